@@ -10,7 +10,9 @@ from urllib.parse import urlparse
 from crawler.config import setup_logger, load_config, get_file_paths
 from crawler.config import MAX_DEPTH, MAX_URLS, NUM_THREADS, DELAY_BETWEEN_REQUESTS
 from crawler.fetcher import WebFetcher
+from crawler.frontier import PriorityFrontier
 from crawler.parser import PageParser
+from crawler.priority import build_scorer
 from crawler.recorder import DataRecorder
 from crawler.utils import normalize_url
 
@@ -39,14 +41,25 @@ class WebCrawler:
             file_paths["temp_file"], file_paths["final_file"], self.logger
         )
 
-        # 訪問済みURLと参照元の追跡用データ構造
+        # 訪問済みURLと参照元、被リンク数の追跡用データ構造
         self.visited = set()
         self.referrers = {}
+        self.inlinks = {}
+
+        # 訪問予定URLの優先度付きキュー
+        scorer = build_scorer(
+            config.get("priority", {}),
+            self.inlinks,
+            os.path.dirname(file_paths["timestamp_dir"]),
+            file_paths["timestamp"],
+            self.logger,
+        )
+        self.frontier = PriorityFrontier(scorer)
 
-    def get_all_links(self, url, depth, url_count):
-        """ページから全ての有効なリンクを抽出して返す"""
-        # 最大深さと最大URL数のチェック
-        if depth > MAX_DEPTH or url_count >= MAX_URLS:
+    def get_all_links(self, url, depth):
+        """ページから全ての有効なリンクを重複なしで抽出して返す"""
+        # 最大深さのチェック
+        if depth > MAX_DEPTH:
             return []
 
         response = self.fetcher.fetch_page(url)
@@ -54,17 +67,28 @@ class WebCrawler:
             return []
 
         links = self.parser.extract_links(response.text, url, self.domain)
-        result_links = []
+        return list(dict.fromkeys(links))
+
+    def enqueue_links(self, links, referrer, depth):
+        """発見したリンクの被リンク数を更新し、未訪問のURLをキューに追加する
 
+        追加したURLの数を返す。
+        """
+        added = 0
         for link in links:
-            # 未訪問のURLのみを追加
-            if link not in self.visited and url_count < MAX_URLS:
+            self.inlinks[link] = self.inlinks.get(link, 0) + 1
+            if link not in self.visited:
+                # 未訪問のURLのみを追加
                 self.visited.add(link)
-                self.referrers[link] = url
-                result_links.append((link, depth + 1))
-                url_count += 1
-
-        return result_links
+                self.referrers[link] = referrer
+                self.frontier.push(link, depth + 1)
+                added += 1
+            elif link in self.frontier:
+                # 被リンク数と深さの変化をキュー内の優先度に反映し、
+                # より浅い経路が見つかった場合は参照元も更新
+                if self.frontier.push(link, depth + 1):
+                    self.referrers[link] = referrer
+        return added
 
     def fetch_and_process_page(self, url, depth):
         """ページを取得して処理し、データを記録する"""
@@ -160,24 +184,24 @@ class WebCrawler:
         """ウェブサイトをクローリングし、情報をCSVに保存"""
         self.logger.info(f"クロール開始: {self.start_url}")
 
-        # 訪問予定URLとその深さを格納するキュー
+        # 開始URLを訪問済みに追加し、キューに入れる
         normalized_start_url = normalize_url(self.start_url)
-        to_visit = [(normalized_start_url, 0)]  # (URL, 深さ)のタプル
-        url_count = 0
-
-        # 開始URLを訪問済みに追加
         self.visited.add(normalized_start_url)
         self.referrers[normalized_start_url] = "Direct Access"
+        self.frontier.push(normalized_start_url, 0)
+        url_count = 0
 
-        while to_visit and url_count < MAX_URLS:
-            # 現在の訪問予定URLバッチ
-            current_batch = to_visit[:NUM_THREADS]
-            to_visit = to_visit[NUM_THREADS:]
+        while self.frontier and url_count < MAX_URLS:
+            # 優先度の高い順に取り出した訪問予定URLバッチ
+            current_batch = self.frontier.pop_batch(
+                min(NUM_THREADS, MAX_URLS - url_count)
+            )
+            url_count += len(current_batch)
 
             with ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
                 # URL取得用のフューチャー
                 link_futures = {
-                    executor.submit(self.get_all_links, url, depth, url_count): (
+                    executor.submit(self.get_all_links, url, depth): (
                         url,
                         depth,
                     )
@@ -198,10 +222,9 @@ class WebCrawler:
                     current_url, depth = link_futures[future]
                     try:
                         links = future.result()
-                        to_visit.extend(links)
-                        url_count += len(links)
+                        added = self.enqueue_links(links, current_url, depth)
                         self.logger.info(
-                            f"クロール中 ({depth}/{MAX_DEPTH}): {current_url} - {len(links)}リンク発見"
+                            f"クロール中 ({depth}/{MAX_DEPTH}): {current_url} - {added}リンク発見"
                         )
                     except Exception as e:
                         self.logger.error(f"リンク取得中のエラー {current_url}: {e}")
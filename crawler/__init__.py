@@ -5,6 +5,8 @@
 # クローラーパッケージの初期化
 from .config import setup_logger, load_config, get_file_paths
 from .fetcher import WebFetcher
+from .frontier import PriorityFrontier
 from .parser import PageParser
+from .priority import build_scorer
 from .recorder import DataRecorder
 from .utils import normalize_url
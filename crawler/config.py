@@ -14,12 +14,14 @@ NUM_THREADS = 4  # 並行スレッド数
 MAX_URLS = 5000  # クロールする最大URL数
 MAX_DEPTH = 10  # クロールする最大深さ
 
+# 日本時間（JST, UTC+9）
+JST = timezone(timedelta(hours=9))
+
 
 # タイムスタンプの取得（日本時間）
 def get_timestamp():
     # UTCから日本時間（JST, UTC+9）に変換
-    jst = timezone(timedelta(hours=9))
-    now_jst = datetime.now(jst)
+    now_jst = datetime.now(JST)
     return now_jst.strftime("%Y%m%d%H%M")
 
 
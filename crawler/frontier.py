@@ -0,0 +1,98 @@
+"""
+クロールフロンティア（訪問予定URLの優先度付きキュー）モジュール
+"""
+
+import heapq
+import itertools
+
+# 無効化されたエントリを示す目印
+_REMOVED = None
+
+
+class PriorityFrontier:
+    """スコアの高いURLから取り出す優先度付きキュー
+
+    heapqによる二分ヒープで実装しており、追加・取り出し・再スコアリングは
+    いずれもO(log n)で行える。スコアが同じ場合は追加順（FIFO）で取り出す。
+    """
+
+    def __init__(self, scorer):
+        self.scorer = scorer
+        # ヒープ本体。要素は [-スコア, 追加順, URL, 深さ] のリスト
+        self._heap = []
+        # URLから現在有効なヒープ要素への参照
+        self._entries = {}
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __bool__(self):
+        return bool(self._entries)
+
+    def __contains__(self, url):
+        return url in self._entries
+
+    def push(self, url, depth):
+        """URLをスコア付きで追加する
+
+        既にキュー内にある場合は浅い方の深さを採用して再スコアリングする。
+        新規追加または深さが浅くなった場合にTrueを返す。
+        """
+        entry = self._entries.get(url)
+        if entry is None:
+            self._push_entry(url, depth)
+            return True
+        if depth < entry[3]:
+            entry[2] = _REMOVED
+            self._push_entry(url, depth)
+            self._compact_if_needed()
+            return True
+        self.rescore(url)
+        return False
+
+    def rescore(self, url):
+        """キュー内のURLのスコアを再計算する
+
+        古い要素は無効化してヒープに残し、取り出し時に読み飛ばす。
+        """
+        entry = self._entries.get(url)
+        if entry is None:
+            return
+        depth = entry[3]
+        score = self.scorer.score(url, depth)
+        if -entry[0] == score:
+            return
+        entry[2] = _REMOVED
+        self._push_entry(url, depth, score)
+        self._compact_if_needed()
+
+    def pop(self):
+        """最もスコアの高い (URL, 深さ) を取り出す"""
+        while self._heap:
+            _, _, url, depth = heapq.heappop(self._heap)
+            if url is not _REMOVED:
+                del self._entries[url]
+                return url, depth
+        raise KeyError("pop from an empty frontier")
+
+    def pop_batch(self, size):
+        """最大size件の (URL, 深さ) をスコア順に取り出す"""
+        batch = []
+        while self._entries and len(batch) < size:
+            batch.append(self.pop())
+        return batch
+
+    def _push_entry(self, url, depth, score=None):
+        """ヒープに新しい要素を追加する"""
+        if score is None:
+            score = self.scorer.score(url, depth)
+        entry = [-score, next(self._counter), url, depth]
+        self._entries[url] = entry
+        heapq.heappush(self._heap, entry)
+
+    def _compact_if_needed(self):
+        """無効化された要素が有効な要素より多くなったらヒープを再構築する"""
+        if len(self._heap) > 2 * len(self._entries) + 1024:
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
@@ -0,0 +1,158 @@
+"""
+URL優先度スコアリングモジュール
+"""
+
+import csv
+import os
+import re
+from datetime import datetime
+
+from .config import JST
+
+# 変更検知に使用するCSVの列
+CHANGE_FIELDS = ["status_code", "title", "h1", "meta_description", "canonical_url"]
+
+# タイムスタンプフォルダ名の形式（get_timestampと同じ）
+TIMESTAMP_FORMAT = "%Y%m%d%H%M"
+
+
+class DepthScorer:
+    """浅いページほど高いスコアを付ける"""
+
+    def score(self, url, depth):
+        return 1.0 / (1 + depth)
+
+
+class InlinkScorer:
+    """これまでに見つかった被リンク数が多いページほど高いスコアを付ける"""
+
+    def __init__(self, inlinks):
+        # URLから被リンク数への辞書（クローラー側で更新される）
+        self.inlinks = inlinks
+
+    def score(self, url, depth):
+        count = self.inlinks.get(url, 0)
+        return count / (1.0 + count)
+
+
+class UrlPatternScorer:
+    """設定された正規表現パターンにマッチしたURLに重みを付ける"""
+
+    def __init__(self, pattern_weights):
+        self.patterns = [
+            (re.compile(pattern), float(weight))
+            for pattern, weight in pattern_weights.items()
+        ]
+
+    def score(self, url, depth):
+        return sum(weight for pattern, weight in self.patterns if pattern.search(url))
+
+
+class FreshnessScorer:
+    """最後の変更からの経過日数が短いページほど高いスコアを付ける
+
+    過去のクロール結果に存在しないURL（新規ページ）は最高スコアとする。
+    """
+
+    def __init__(self, days_since_change):
+        # URLから最終変更日からの経過日数への辞書
+        self.days_since_change = days_since_change
+
+    def score(self, url, depth):
+        days = self.days_since_change.get(url)
+        if days is None:
+            return 1.0
+        return 1.0 / (1 + days)
+
+
+class CompositeScorer:
+    """複数のスコアラーの重み付き合計を計算する"""
+
+    def __init__(self, weighted_scorers):
+        # (スコアラー, 重み) のリスト
+        self.weighted_scorers = weighted_scorers
+
+    def score(self, url, depth):
+        return sum(
+            weight * scorer.score(url, depth)
+            for scorer, weight in self.weighted_scorers
+        )
+
+
+def load_change_history(output_dir, current_timestamp, max_runs, logger):
+    """過去のクロール結果から、URLごとの最終変更日からの経過日数を求める
+
+    output_dir配下のタイムスタンプフォルダにあるcrawl_result.csvを古い順に読み、
+    各URLの内容（CHANGE_FIELDS）が前回から変わった、または初めて現れた実行日時を
+    最終変更日時とする。
+    """
+    try:
+        run_dirs = sorted(
+            name
+            for name in os.listdir(output_dir)
+            if name.isdigit()
+            and len(name) == len(current_timestamp)
+            and name < current_timestamp
+            and os.path.isfile(os.path.join(output_dir, name, "crawl_result.csv"))
+        )
+    except OSError as e:
+        logger.warning(f"過去のクロール結果の読み込みに失敗しました: {e}")
+        return {}
+
+    signatures = {}
+    changed_at = {}
+    for name in run_dirs[-max_runs:] if max_runs > 0 else []:
+        run_time = datetime.strptime(name, TIMESTAMP_FORMAT).replace(tzinfo=JST)
+        result_file = os.path.join(output_dir, name, "crawl_result.csv")
+        try:
+            with open(result_file, mode="r", encoding="utf-8") as file:
+                for row in csv.DictReader(file):
+                    url = row.get("url")
+                    if not url:
+                        continue
+                    signature = tuple(row.get(field) for field in CHANGE_FIELDS)
+                    if signatures.get(url) != signature:
+                        signatures[url] = signature
+                        changed_at[url] = run_time
+        except Exception as e:
+            logger.warning(f"過去のクロール結果の読み込み中のエラー {result_file}: {e}")
+
+    now = datetime.strptime(current_timestamp, TIMESTAMP_FORMAT).replace(tzinfo=JST)
+    return {
+        url: (now - run_time).total_seconds() / 86400
+        for url, run_time in changed_at.items()
+    }
+
+
+def build_scorer(priority_config, inlinks, output_dir, current_timestamp, logger):
+    """config.jsonの"priority"設定からスコアラーを組み立てる
+
+    設定がない場合は深さのみでスコアリングする（幅優先探索と同じ順序）。
+    """
+    weights = priority_config.get("weights", {"depth": 1.0})
+    weighted_scorers = []
+
+    if weights.get("depth"):
+        weighted_scorers.append((DepthScorer(), float(weights["depth"])))
+
+    if weights.get("inlinks"):
+        weighted_scorers.append((InlinkScorer(inlinks), float(weights["inlinks"])))
+
+    if weights.get("url_patterns"):
+        pattern_weights = priority_config.get("url_pattern_weights", {})
+        weighted_scorers.append(
+            (UrlPatternScorer(pattern_weights), float(weights["url_patterns"]))
+        )
+
+    if weights.get("freshness"):
+        days_since_change = load_change_history(
+            output_dir,
+            current_timestamp,
+            priority_config.get("history_runs", 10),
+            logger,
+        )
+        weighted_scorers.append(
+            (FreshnessScorer(days_since_change), float(weights["freshness"]))
+        )
+
+    return CompositeScorer(weighted_scorers)
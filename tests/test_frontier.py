@@ -0,0 +1,127 @@
+"""
+PriorityFrontierとスコアラーのテスト
+"""
+
+import csv
+import logging
+import os
+
+from crawler.config import CSV_FIELDS
+from crawler.frontier import PriorityFrontier
+from crawler.priority import build_scorer, load_change_history
+
+logger = logging.getLogger("test")
+
+
+class DictScorer:
+    """URLごとに固定のスコアを返すテスト用スコアラー"""
+
+    def __init__(self, scores):
+        self.scores = scores
+
+    def score(self, url, depth):
+        return self.scores.get(url, 0.0)
+
+
+def drain(frontier):
+    return [frontier.pop() for _ in range(len(frontier))]
+
+
+def write_result(output_dir, timestamp, rows):
+    run_dir = os.path.join(output_dir, timestamp)
+    os.makedirs(run_dir)
+    with open(
+        os.path.join(run_dir, "crawl_result.csv"), "w", newline="", encoding="utf-8"
+    ) as file:
+        writer = csv.DictWriter(file, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({field: row.get(field, "") for field in CSV_FIELDS})
+
+
+def test_pop_order_by_score_with_fifo_ties():
+    frontier = PriorityFrontier(DictScorer({"a": 1.0, "b": 2.0, "c": 1.0, "d": 2.0}))
+    for url in ["a", "b", "c", "d"]:
+        frontier.push(url, 0)
+
+    assert [url for url, _ in drain(frontier)] == ["b", "d", "a", "c"]
+    assert not frontier
+
+
+def test_rescore_moves_url_up():
+    scores = {"a": 2.0, "b": 1.0}
+    frontier = PriorityFrontier(DictScorer(scores))
+    frontier.push("a", 0)
+    frontier.push("b", 0)
+
+    scores["b"] = 3.0
+    frontier.rescore("b")
+
+    assert [url for url, _ in drain(frontier)] == ["b", "a"]
+
+
+def test_compaction_keeps_order():
+    scores = {f"u{i}": float(i) for i in range(10)}
+    frontier = PriorityFrontier(DictScorer(scores))
+    for url in scores:
+        frontier.push(url, 0)
+
+    # 無効化された要素を閾値以上に溜めて再構築を発生させる
+    for step in range(2000):
+        url = f"u{step % 10}"
+        scores[url] += 10.0
+        frontier.rescore(url)
+    assert len(frontier._heap) <= 2 * len(frontier) + 1024
+
+    expected = sorted(scores, key=lambda url: -scores[url])
+    assert [url for url, _ in drain(frontier)] == expected
+
+
+def test_depth_only_scorer_matches_breadth_first_order():
+    frontier = PriorityFrontier(build_scorer({}, {}, ".", "202501010000", logger))
+    pushed = [("d2-a", 2), ("d1-a", 1), ("d0", 0), ("d1-b", 1), ("d2-b", 2)]
+    for url, depth in pushed:
+        frontier.push(url, depth)
+
+    assert drain(frontier) == [
+        ("d0", 0),
+        ("d1-a", 1),
+        ("d1-b", 1),
+        ("d2-a", 2),
+        ("d2-b", 2),
+    ]
+
+
+def test_push_keeps_shallower_depth():
+    frontier = PriorityFrontier(build_scorer({}, {}, ".", "202501010000", logger))
+    assert frontier.push("/x/", 3)
+    frontier.push("/y/", 2)
+
+    assert frontier.push("/x/", 1)
+    assert not frontier.push("/x/", 4)
+
+    assert drain(frontier) == [("/x/", 1), ("/y/", 2)]
+
+
+def test_load_change_history(tmp_path):
+    output_dir = str(tmp_path)
+    write_result(
+        output_dir,
+        "202501010000",
+        [
+            {"url": "https://ex.com/same/", "status_code": "200", "title": "A"},
+            {"url": "https://ex.com/changed/", "status_code": "200", "title": "B"},
+        ],
+    )
+    write_result(
+        output_dir,
+        "202501060000",
+        [
+            {"url": "https://ex.com/same/", "status_code": "200", "title": "A"},
+            {"url": "https://ex.com/changed/", "status_code": "200", "title": "B2"},
+        ],
+    )
+
+    days = load_change_history(output_dir, "202501110000", 10, logger)
+
+    assert days == {"https://ex.com/same/": 10.0, "https://ex.com/changed/": 5.0}